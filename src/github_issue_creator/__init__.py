@@ -1,3 +1,9 @@
 """Issue Creator package."""
 
-from github_issue_creator.github_issue_creator import Issue, IssueCreationError, IssueCreator  # noqa: F401
+from github_issue_creator.exceptions import GitHubAPIError  # noqa: F401
+from github_issue_creator.github_issue_creator import (  # noqa: F401
+    Issue,
+    IssueCreationError,
+    IssueCreator,
+    IssueFetchError,
+)
@@ -1,3 +1,3 @@
 """Exceptions package."""
 
-from github_issue_creator.exceptions.exceptions import IssueCreationError  # noqa: F401
+from github_issue_creator.exceptions.exceptions import GitHubAPIError, IssueCreationError, IssueFetchError  # noqa: F401
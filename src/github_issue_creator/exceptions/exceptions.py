@@ -1,11 +1,13 @@
 """Custom exceptions."""
 
+from __future__ import annotations
 
-class IssueCreationError(Exception):
-    """Custom exception raised when an issue creation fails."""
 
-    def __init__(self, message: str, status_code: int = None, response_text: str = None):
-        """Initialize an IssueCreationError instance.
+class GitHubAPIError(Exception):
+    """Base exception for failed requests to the GitHub API."""
+
+    def __init__(self, message: str, status_code: int | None = None, response_text: str | None = None) -> None:
+        """Initialize a GitHubAPIError instance.
 
         :param message: The error message to display.
         :param status_code: (Optional) The HTTP status code associated with the error.
@@ -15,15 +17,23 @@ class IssueCreationError(Exception):
         self.response_text = response_text
         super().__init__(message)
 
-    def __str__(self):
-        """Return a string representation of the IssueCreationError.
+    def __str__(self) -> str:
+        """Return a string representation of the error.
 
         Combines the error message, optional status code, and optional response text
         into a single formatted string for display or logging.
         """
-        base_msg = f"IssueCreationError: {self.args[0]}"
+        base_msg = f"{type(self).__name__}: {self.args[0]}"
         if self.status_code:
             base_msg += f" | Status code: {self.status_code}"
         if self.response_text:
             base_msg += f" | Response: {self.response_text}"
         return base_msg
+
+
+class IssueCreationError(GitHubAPIError):
+    """Custom exception raised when an issue creation fails."""
+
+
+class IssueFetchError(GitHubAPIError):
+    """Custom exception raised when fetching an existing issue fails."""
@@ -1,18 +1,146 @@
 """IssueCreator."""
 
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
 
-from github_issue_creator.exceptions import IssueCreationError
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+from github_issue_creator.exceptions import IssueCreationError, IssueFetchError
 from github_issue_creator.models.issue import Issue
 from github_issue_creator.models.issue_response import IssueResponse
 
+if httpx is None:
+    _REQUEST_ERRORS: tuple[type[Exception], ...] = (requests.RequestException,)
+else:
+    _REQUEST_ERRORS = (requests.RequestException, httpx.RequestError)
+
+_API_ROOT: str = "https://api.github.com/"
+_HTML_ROOT: str = "https://github.com/"
+_PREWARM_TIMEOUT: int = 2
+_TRANSPORTS: tuple[str, ...] = ("requests", "httpx")
+_JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+_POOL_SIZE: int = 32
+_RETRY_STATUSES: tuple[int, ...] = (502, 503, 504)
+_RETRY_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+_RATE_LIMITED_STATUSES: tuple[int, ...] = (403, 429)
+
+_SessionKey = tuple[frozenset[tuple[str, str]], str]
+
+# Shared sessions with the number of IssueCreator instances currently holding each of them.
+_SESSIONS: dict[_SessionKey, tuple[requests.Session, int]] = {}
+_SESSIONS_LOCK: threading.Lock = threading.Lock()
+
+
+def _auth_headers(token: str) -> dict[str, str]:
+    """Returns the headers sent with every request to the GitHub API."""
+    return {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
+
+
+def _make_adapter() -> HTTPAdapter:
+    """Builds the HTTPAdapter mounted on the requests sessions.
+
+    The pool is sized so concurrent callers reuse kept-alive sockets instead of having urllib3
+    discard and reopen them. Connection failures are retried for every method, since nothing has
+    reached GitHub yet. Gateway errors are only retried for the idempotent ``get_issue`` GET and
+    prewarm HEAD requests: the issue creation POST is sent once, because GitHub may have created the
+    issue despite the error and resending it could create a duplicate. Once retries are exhausted the
+    last response is returned so it still surfaces as an HTTP error.
+
+    ``Retry-After`` is not handled here: a 403 or 429 is returned as is so that ``IssueCreator``'s
+    own rate limit tracking sees it and backs off, instead of the adapter silently resending.
+
+    Read errors are never retried (``read=0``), for the same reason as gateway errors on POST.
+    """
+    return HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_RETRY_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+    )
+
+
+def _make_session(token: str, proxy: dict[str, str] | None) -> requests.Session:
+    """Creates a requests session authenticated with the given token."""
+    session: requests.Session = requests.Session()
+    if proxy:
+        session.proxies.update(proxy)
+    session.headers.update(_auth_headers(token))
+    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+    session.mount("https://", _make_adapter())
+    return session
+
+
+def _acquire_session(token: str, proxy: dict[str, str] | None) -> tuple[_SessionKey, requests.Session]:
+    """Returns the session shared by every IssueCreator using the same token and proxy settings.
+
+    Each call takes a reference on the session, to be given back with ``_release_session``.
+    """
+    key: _SessionKey = (frozenset((proxy or {}).items()), token)
+    with _SESSIONS_LOCK:
+        session, references = _SESSIONS.get(key) or (_make_session(token, proxy), 0)
+        _SESSIONS[key] = (session, references + 1)
+    return key, session
+
+
+def _release_session(key: _SessionKey) -> None:
+    """Gives back a reference taken by ``_acquire_session``, closing the session with the last one."""
+    with _SESSIONS_LOCK:
+        entry: tuple[requests.Session, int] | None = _SESSIONS.get(key)
+        if entry is None:
+            return
+        session, references = entry
+        if references > 1:
+            _SESSIONS[key] = (session, references - 1)
+            return
+        del _SESSIONS[key]
+
+    session.close()
+
+
+def _int_header(response: "requests.Response | httpx.Response", name: str) -> int | None:
+    """Returns the value of an integer response header, or None if it is missing or malformed."""
+    try:
+        return int(response.headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
 
 class IssueCreator:
     """A class to create GitHub issues using the GitHub REST API."""
 
-    def __init__(self, token: str, repo_owner: str, repo_name: str, proxy: dict[str, str] = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        repo_owner: str,
+        repo_name: str,
+        proxy: dict[str, str] | None = None,
+        transport: str = "requests",
+        rate_limit_threshold: int = 0,
+        prewarm: bool = False,
+    ) -> None:
         """Initializes the IssueCreator instance.
 
         Args:
@@ -20,10 +148,20 @@ class IssueCreator:
             repo_owner (str): Repository owner's username.
             repo_name (str): Name of the repository.
             proxy (dict[str, str], optional): Proxy settings for the HTTP session. Defaults to None.
+            transport (str, optional): HTTP client used by ``create``. ``"requests"`` uses a
+                ``requests.Session``; ``"httpx"`` uses an HTTP/2 ``httpx.Client`` so concurrent calls
+                are multiplexed over a single connection. Defaults to ``"requests"``.
+            rate_limit_threshold (int, optional): Once GitHub reports this many remaining requests or
+                fewer, the next request waits until the rate limit window resets. Defaults to 0.
+            prewarm (bool, optional): Open the connection to the GitHub API in a background thread
+                during construction, so the DNS lookup and TCP/TLS handshakes are done by the time the
+                first request is sent. Defaults to False.
 
         Raises:
             ValueError: If token, repo_owner, or repo_name is not provided.
             ValueError: If proxy is not a dictionary.
+            ValueError: If transport is not supported.
+            ImportError: If transport is ``"httpx"`` and httpx is not installed.
         """
         if not token:
             raise ValueError("GitHub token is required.")
@@ -31,24 +169,78 @@ class IssueCreator:
             raise ValueError("Repository owner is required.")
         if not repo_name:
             raise ValueError("Repository name is required.")
+        if transport not in _TRANSPORTS:
+            raise ValueError(f"Transport must be one of: {', '.join(_TRANSPORTS)}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError("The httpx transport requires httpx: pip install github-issue-creator[httpx]")
 
         self._token: str = token
         self._repo_owner: str = repo_owner
         self._repo_name: str = repo_name
-        self._proxy: dict[str, str] = proxy
+        self._proxy: dict[str, str] | None = proxy
+        # Both URLs only depend on the repository, so they are built once rather than on every request.
+        self._issues_url: str = f"{_API_ROOT}repos/{repo_owner}/{repo_name}/issues"
+        self._repo_url: str = f"{_HTML_ROOT}{repo_owner}/{repo_name}"
+        self._headers: dict[str, str] = _auth_headers(self._token)
+        self._session: requests.Session | None = None
+        self._client: "httpx.Client | None" = None
+        self._session_key: _SessionKey | None = None
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        self._rate_limit_threshold: int = rate_limit_threshold
+        self._rate_limit_lock: threading.Lock = threading.Lock()
+        self._rate_limit_remaining: int | None = None
+        self._rate_limit_reset: float = 0.0
+        self._retry_after_until: float = 0.0
 
-        if self._proxy:
-            if self._proxy and not isinstance(self._proxy, dict):
-                raise ValueError("Proxy must be a dictionary")
+        if self._proxy and not isinstance(self._proxy, dict):
+            raise ValueError("Proxy must be a dictionary")
 
-            self._session: requests.Session = requests.Session()
-            self._session.proxies.update(self._proxy)
+        self._http: "requests.Session | httpx.Client"
+        if transport == "httpx":
+            self._client = self._http = httpx.Client(http2=True, headers=self._headers, proxy=self._https_proxy())
         else:
-            self._session: requests.Session = requests.Session()
+            self._session_key, self._session = _acquire_session(self._token, self._proxy)
+            self._http = self._session
 
-        self._session.headers.update(
-            {"Authorization": f"token {self._token}", "Accept": "application/vnd.github.v3+json"}
-        )
+        if prewarm:
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def __enter__(self) -> "IssueCreator":
+        """Returns the instance itself, so it can be used as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the instance when leaving the ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Releases the HTTP connections held by this instance.
+
+        With the ``"httpx"`` transport this closes the instance's ``httpx.Client`` and its HTTP/2
+        connections. With ``"requests"``, the session shared with other instances using the same
+        token and proxy settings is closed once the last of them is closed, so pools for tokens that
+        are no longer used (for example expired installation tokens) do not pile up.
+        """
+        if self._client is not None:
+            self._client.close()
+        if self._session_key is not None:
+            _release_session(self._session_key)
+            self._session_key = None
+
+    @classmethod
+    def close_all(cls: type["IssueCreator"]) -> None:
+        """Closes the HTTP sessions shared by all IssueCreator instances.
+
+        Sessions are pooled per (proxy, token) pair so that instances created for the same credentials
+        reuse open connections. Call this during shutdown to release them; instances created afterwards
+        get fresh sessions.
+        """
+        with _SESSIONS_LOCK:
+            sessions: list[requests.Session] = [session for session, _ in _SESSIONS.values()]
+            _SESSIONS.clear()
+
+        for session in sessions:
+            session.close()
 
     def create(self, issue: Issue, timeout: int = 10) -> IssueResponse:
         """Creates a new GitHub issue and returns useful information.
@@ -62,37 +254,261 @@ class IssueCreator:
 
         Raises:
             IssueCreationError: If the issue creation fails.
+
+        Note:
+            To follow up on the created issue, poll it with ``get_issue(response.issue_number)`` rather
+            than fetching it by hand: repeated calls are conditional requests, and the resulting
+            ``304 Not Modified`` responses do not count against GitHub's rate limit.
         """
-        url: str = f"https://api.github.com/repos/{self._repo_owner}/{self._repo_name}/issues"
-        data: dict[str, Any] = issue.model_dump()
-        response: requests.Response | None = None
+        body: bytes = issue.model_dump_json().encode()
+        self.wait_if_needed()
 
         try:
-            response = self._session.post(url, json=data, timeout=timeout)
-            response.raise_for_status()
-        except requests.HTTPError:
-            raise IssueCreationError(
-                message="HTTP error occurred while creating the issue.",
-                status_code=response.status_code,
-                response_text=response.text,
-            )
-        except requests.RequestException as e:
+            response = self._post(body, timeout)
+        except _REQUEST_ERRORS as e:
             raise IssueCreationError(message=f"Request failed: {str(e)}")
 
-        if response.status_code != 201:
-            raise IssueCreationError(
-                message="Failed to create issue.", status_code=response.status_code, response_text=response.text
-            )
-
-        response_data: Any = response.json()
-
-        return IssueResponse(
-            repository_url=f"https://github.com/{self._repo_owner}/{self._repo_name}",
-            issue_url=response_data.get("html_url"),
-            issue_id=response_data.get("id"),
-            issue_number=response_data.get("number"),
-            issue_title=response_data.get("title"),
-            issue_state=response_data.get("state"),
-            created_at=response_data.get("created_at"),
-            author=response_data.get("user", {}).get("login"),
+        return self._parse_response(response)
+
+    def wait_if_needed(self) -> None:
+        """Blocks until the next request can be sent without exceeding GitHub's rate limits.
+
+        Waits until the rate limit window resets when the last reported ``X-RateLimit-Remaining``
+        is at or below ``rate_limit_threshold``, and honors any ``Retry-After`` received with a 403
+        or 429 response. Returns immediately otherwise.
+        """
+        delay: float = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
+
+    def get_issue(self, issue_number: int, timeout: int = 10) -> IssueResponse:
+        """Fetches an existing issue of the repository.
+
+        Responses are cached by ETag: subsequent calls for the same issue send ``If-None-Match`` and
+        reuse the cached data when GitHub answers ``304 Not Modified``.
+
+        Args:
+            issue_number (int): The number of the issue in the repository.
+            timeout (int): Timeout for the HTTP request in seconds.
+
+        Returns:
+            IssueResponse: Information about the issue.
+
+        Raises:
+            IssueFetchError: If the issue cannot be fetched.
+        """
+        return self._to_issue_response(self._get(f"{self._issues_url}/{issue_number}", timeout))
+
+    def create_many(
+        self, issues: list[Issue], max_concurrency: int = 10, timeout: int = 10
+    ) -> list[IssueResponse | IssueCreationError]:
+        """Creates several GitHub issues concurrently.
+
+        Requests are dispatched through a single ``httpx.AsyncClient`` so the TLS connection is shared,
+        with at most ``max_concurrency`` requests in flight at once. Requires the optional ``httpx``
+        dependency (``pip install github-issue-creator[httpx]``).
+
+        This method runs its own event loop and cannot be called from a running one (for example
+        inside an async application or a Jupyter notebook); ``await acreate_many(...)`` there instead.
+
+        Args:
+            issues (list[Issue]): The issues to create.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            timeout (int): Timeout for each HTTP request in seconds.
+
+        Returns:
+            list[IssueResponse | IssueCreationError]: One entry per issue, in the same order as ``issues``.
+            Failed creations are returned as ``IssueCreationError`` instances instead of being raised.
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1.
+            ImportError: If httpx is not installed.
+            RuntimeError: If called while an event loop is running.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.acreate_many(issues, max_concurrency, timeout))
+
+        raise RuntimeError("create_many cannot be called from a running event loop; await acreate_many instead.")
+
+    async def acreate_many(
+        self, issues: list[Issue], max_concurrency: int = 10, timeout: int = 10
+    ) -> list[IssueResponse | IssueCreationError]:
+        """Creates several GitHub issues concurrently from a running event loop.
+
+        Coroutine counterpart of ``create_many``, for use in async applications and notebooks.
+
+        Args:
+            issues (list[Issue]): The issues to create.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            timeout (int): Timeout for each HTTP request in seconds.
+
+        Returns:
+            list[IssueResponse | IssueCreationError]: One entry per issue, in the same order as ``issues``.
+            Failed creations are returned as ``IssueCreationError`` instances instead of being raised.
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1.
+            ImportError: If httpx is not installed.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if httpx is None:
+            raise ImportError("create_many requires httpx: pip install github-issue-creator[httpx]")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(client: "httpx.AsyncClient", issue: Issue) -> IssueResponse:
+            async with semaphore:
+                delay: float = self._rate_limit_delay()
+                if delay:
+                    await asyncio.sleep(delay)
+                return await self._create_one(client, issue, timeout)
+
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self._headers,
+            proxy=self._https_proxy(),
+            limits=httpx.Limits(max_keepalive_connections=max_concurrency),
+        ) as client:
+            results = await asyncio.gather(*(bounded(client, issue) for issue in issues), return_exceptions=True)
+
+        return [
+            result if isinstance(result, (IssueResponse, IssueCreationError)) else self._to_issue_error(result)
+            for result in results
+        ]
+
+    async def _create_one(self, client: "httpx.AsyncClient", issue: Issue, timeout: int) -> IssueResponse:
+        """Creates a single issue through an ``httpx.AsyncClient``.
+
+        Raises:
+            IssueCreationError: If the issue creation fails.
+        """
+        body: bytes = issue.model_dump_json().encode()
+
+        try:
+            response = await client.post(self._issues_url, content=body, headers=_JSON_HEADERS, timeout=timeout)
+        except httpx.RequestError as e:
+            raise IssueCreationError(message=f"Request failed: {str(e)}")
+
+        return self._parse_response(response)
+
+    def _get(self, url: str, timeout: int) -> Any:
+        """Sends a conditional GET request and returns the parsed JSON body.
+
+        The ETag of every 200 response is cached along with its body; when a later request for the
+        same URL is answered with 304, the cached body is returned instead.
+
+        Raises:
+            IssueFetchError: If the request fails or returns an unexpected status code.
+        """
+        cached: tuple[str, Any] | None = self._etag_cache.get(url)
+        headers: dict[str, str] | None = {"If-None-Match": cached[0]} if cached else None
+        self.wait_if_needed()
+
+        try:
+            response = self._http.get(url, headers=headers, timeout=timeout)
+        except _REQUEST_ERRORS as e:
+            raise IssueFetchError(message=f"Request failed: {str(e)}")
+
+        self._update_rate_limit(response)
+        status_code: int = response.status_code
+        if status_code == 304 and cached:
+            return cached[1]
+        if status_code == 200:
+            response_data: Any = _json_loads(response.content)
+            etag: str | None = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[url] = (etag, response_data)
+            return response_data
+
+        raise IssueFetchError(
+            message="HTTP error occurred while fetching the issue." if status_code >= 400 else "Failed to fetch issue.",
+            status_code=status_code,
+            response_text=response.text,
+        )
+
+    def _prewarm(self) -> None:
+        """Sends a cheap request to the GitHub API so an open connection is waiting in the pool."""
+        try:
+            self._http.head(_API_ROOT, timeout=_PREWARM_TIMEOUT)
+        except _REQUEST_ERRORS:
+            pass
+
+    def _rate_limit_delay(self) -> float:
+        """Returns how many seconds to wait before sending the next request."""
+        with self._rate_limit_lock:
+            now: float = time.time()
+            delay: float = self._retry_after_until - now
+            if self._rate_limit_remaining is not None and self._rate_limit_remaining <= self._rate_limit_threshold:
+                delay = max(delay, self._rate_limit_reset - now)
+        return max(0.0, delay)
+
+    def _update_rate_limit(self, response: "requests.Response | httpx.Response") -> None:
+        """Records the rate limit state reported by a GitHub API response."""
+        remaining: int | None = _int_header(response, "X-RateLimit-Remaining")
+        reset: int | None = _int_header(response, "X-RateLimit-Reset")
+        retry_after: int | None = (
+            _int_header(response, "Retry-After") if response.status_code in _RATE_LIMITED_STATUSES else None
+        )
+
+        with self._rate_limit_lock:
+            if remaining is not None:
+                self._rate_limit_remaining = remaining
+            if reset is not None:
+                self._rate_limit_reset = float(reset)
+            if retry_after is not None:
+                self._retry_after_until = time.time() + retry_after
+
+    def _post(self, body: bytes, timeout: int) -> "requests.Response | httpx.Response":
+        """Sends an already serialized JSON body to the issues endpoint through the configured transport."""
+        if isinstance(self._http, requests.Session):
+            return self._http.post(self._issues_url, data=body, headers=_JSON_HEADERS, timeout=timeout)
+        return self._http.post(self._issues_url, content=body, headers=_JSON_HEADERS, timeout=timeout)
+
+    def _https_proxy(self) -> str | None:
+        """Returns the proxy URL used for ``https://`` requests by the httpx clients, if any."""
+        return self._proxy.get("https") if self._proxy else None
+
+    def _parse_response(self, response: "requests.Response | httpx.Response") -> IssueResponse:
+        """Returns the IssueResponse for a 201 response, or raises IssueCreationError for anything else.
+
+        The status code is tested directly rather than through ``raise_for_status``, so the success
+        path costs a single integer comparison.
+        """
+        self._update_rate_limit(response)
+        status_code: int = response.status_code
+        if status_code == 201:
+            return self._to_issue_response(_json_loads(response.content))
+
+        raise IssueCreationError(
+            message=(
+                "HTTP error occurred while creating the issue." if status_code >= 400 else "Failed to create issue."
+            ),
+            status_code=status_code,
+            response_text=response.text,
+        )
+
+    @staticmethod
+    def _to_issue_error(error: BaseException) -> IssueCreationError:
+        """Wraps an unexpected exception raised by a concurrent task into an IssueCreationError."""
+        return IssueCreationError(message=f"Request failed: {str(error)}")
+
+    def _to_issue_response(self, response_data: Any) -> IssueResponse:
+        """Builds an IssueResponse from the JSON body returned by the GitHub API.
+
+        The body comes straight from GitHub with the documented types, so the model is built with
+        ``model_construct`` and field validation is skipped.
+        """
+        user: dict[str, Any] | None = response_data.get("user")
+        return IssueResponse.model_construct(
+            repository_url=self._repo_url,
+            issue_url=response_data["html_url"],
+            issue_id=response_data["id"],
+            issue_number=response_data["number"],
+            issue_title=response_data["title"],
+            issue_state=response_data["state"],
+            created_at=response_data["created_at"],
+            author=user.get("login") if user else None,
         )
@@ -1,11 +1,81 @@
 """Test IssueCreator."""
 
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
-from src.github_issue_creator import Issue, IssueCreationError, IssueCreator
+from github_issue_creator.github_issue_creator import _make_adapter
+from github_issue_creator.models.issue_response import IssueResponse
+from src.github_issue_creator import GitHubAPIError, Issue, IssueCreationError, IssueCreator, IssueFetchError
+
+
+def _issue_json(**overrides: Any) -> dict[str, Any]:
+    """Return a GitHub API issue payload, with the given fields replaced."""
+    return {
+        "id": 123456,
+        "number": 1,
+        "title": "Test",
+        "state": "open",
+        "created_at": "2024-06-01T00:00:00Z",
+        "html_url": "https://github.com/fake_owner/fake_repo/issues/1",
+        "user": {"login": "test_user"},
+        **overrides,
+    }
+
+
+@contextmanager
+def _local_server(status: int, headers: dict[str, str] | None = None) -> Iterator[tuple[str, Counter[str]]]:
+    """Run a local HTTP server that answers every request with the given status and headers.
+
+    Yields the server's base URL and a counter of the requests received, by method.
+    """
+    request_counts: Counter[str] = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self) -> None:
+            request_counts[self.command] += 1
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            body = b"Error"
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        do_GET = do_HEAD = do_POST = _respond
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", request_counts
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _local_creator(token: str, base_url: str) -> IssueCreator:
+    """Return an IssueCreator whose requests go through the real session adapter to a local server."""
+    creator = IssueCreator(token, "fake_owner", "fake_repo")
+    creator._session.trust_env = False
+    creator._session.mount("http://", _make_adapter())
+    creator._issues_url = f"{base_url}/repos/fake_owner/fake_repo/issues"
+    return creator
 
 
 def test_create_issue_success() -> None:
@@ -20,20 +90,17 @@ def test_create_issue_success() -> None:
 
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_response.json.return_value = {
-        "id": 123456,
-        "number": 1,
-        "title": "Test",
-        "state": "open",
-        "created_at": "2024-06-01T00:00:00Z",
-        "html_url": "https://github.com/fake_owner/fake_repo/issues/1",
-        "user": {"login": "test_user"},
-    }
+    mock_response.content = json.dumps(_issue_json()).encode()
 
     with patch.object(creator._session, "post", return_value=mock_response) as mock_post:
         result = creator.create(issue)
 
         mock_post.assert_called_once()
+        args, kwargs = mock_post.call_args
+        assert args == ("https://api.github.com/repos/fake_owner/fake_repo/issues",)
+        assert json.loads(kwargs["data"]) == {"title": "Test", "body": "This is a test", "labels": [], "assignees": []}
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        mock_response.raise_for_status.assert_not_called()
         assert result.__class__.__name__ == "IssueResponse"
         assert result.__class__.__module__ == "github_issue_creator.models.issue_response"
         assert result.issue_url == "https://github.com/fake_owner/fake_repo/issues/1"
@@ -120,15 +187,7 @@ def test_create_issue_success_with_proxy() -> None:
 
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_response.json.return_value = {
-        "id": 123456,
-        "number": 1,
-        "title": "Test",
-        "state": "open",
-        "created_at": "2024-06-01T00:00:00Z",
-        "html_url": "https://github.com/fake_owner/fake_repo/issues/1",
-        "user": {"login": "test_user"},
-    }
+    mock_response.content = json.dumps(_issue_json()).encode()
 
     with patch.object(creator._session, "post", return_value=mock_response) as mock_post:
         result = creator.create(issue)
@@ -152,3 +211,456 @@ def test_create_issue_with_invalid_proxy() -> None:
     """
     with pytest.raises(ValueError, match="Proxy must be a dictionary"):
         IssueCreator("fake_token", "fake_owner", "fake_repo", proxy="invalid_proxy")
+
+
+def test_create_many_success() -> None:
+    """Test concurrent creation of several issues.
+
+    This test verifies that IssueCreator.create_many() returns one IssueResponse per issue,
+    in the same order as the input list, when the GitHub API returns 201 for every request.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    issues = [Issue(title=f"Test {i}", body="This is a test") for i in range(3)]
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    async def fake_post(url: str, content: bytes, headers: dict[str, str], timeout: int) -> httpx.Response:
+        data = json.loads(content)
+        number = int(data["title"].split()[-1])
+        return httpx.Response(
+            201,
+            json=_issue_json(
+                id=1000 + number,
+                number=number,
+                title=data["title"],
+                html_url=f"https://github.com/fake_owner/fake_repo/issues/{number}",
+            ),
+        )
+
+    with patch.object(httpx.AsyncClient, "post", side_effect=fake_post) as mock_post:
+        results = creator.create_many(issues, max_concurrency=2)
+
+        assert mock_post.call_count == 3
+        assert [result.issue_number for result in results] == [0, 1, 2]
+        assert [result.issue_title for result in results] == ["Test 0", "Test 1", "Test 2"]
+        assert all(result.repository_url == "https://github.com/fake_owner/fake_repo" for result in results)
+
+
+def test_create_many_partial_failure() -> None:
+    """Test error handling during concurrent issue creation.
+
+    This test verifies that a failed request does not interrupt the batch: HTTP errors and
+    network errors are returned as IssueCreationError instances in place of the IssueResponse.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    issues = [Issue(title=title, body="This is a test") for title in ("ok", "bad", "down")]
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    async def fake_post(url: str, content: bytes, headers: dict[str, str], timeout: int) -> httpx.Response:
+        title = json.loads(content)["title"]
+        if title == "bad":
+            return httpx.Response(422, text="Unprocessable Entity")
+        if title == "down":
+            raise httpx.ConnectError("Network Error")
+        return httpx.Response(
+            201,
+            json=_issue_json(title="ok"),
+        )
+
+    with patch.object(httpx.AsyncClient, "post", side_effect=fake_post):
+        ok, bad, down = creator.create_many(issues)
+
+    assert ok.issue_id == 123456
+    assert isinstance(bad, IssueCreationError)
+    assert bad.status_code == 422
+    assert "Unprocessable Entity" in bad.response_text
+    assert isinstance(down, IssueCreationError)
+    assert "Request failed: Network Error" in str(down)
+
+
+def test_create_many_invalid_concurrency() -> None:
+    """Test that create_many rejects a max_concurrency lower than 1."""
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1."):
+        creator.create_many([Issue(title="Test", body="This is a test")], max_concurrency=0)
+
+
+def test_create_issue_success_with_httpx_transport() -> None:
+    """Test successful creation of an issue through the httpx transport.
+
+    This test verifies that when the IssueCreator is configured with transport="httpx",
+    the request is sent through the HTTP/2 httpx client and the IssueResponse is built as usual.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo", transport="httpx")
+
+    response = httpx.Response(
+        201,
+        json=_issue_json(),
+        request=httpx.Request("POST", "https://api.github.com/repos/fake_owner/fake_repo/issues"),
+    )
+
+    with patch.object(creator._client, "post", return_value=response) as mock_post:
+        result = creator.create(issue)
+
+        mock_post.assert_called_once()
+        assert creator._session is None
+        assert result.issue_id == 123456
+        assert result.author == "test_user"
+
+
+def test_create_issue_http_error_with_httpx_transport() -> None:
+    """Test HTTP error handling during issue creation through the httpx transport.
+
+    This test verifies that httpx status errors are mapped to an IssueCreationError with
+    the same message, status code, and response text as with the requests transport.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo", transport="httpx")
+
+    response = httpx.Response(
+        400,
+        text="Bad Request",
+        request=httpx.Request("POST", "https://api.github.com/repos/fake_owner/fake_repo/issues"),
+    )
+
+    with patch.object(creator._client, "post", return_value=response):
+        with pytest.raises(IssueCreationError) as exc_info:
+            creator.create(issue)
+        assert "HTTP error occurred while creating the issue." in str(exc_info.value)
+        assert exc_info.value.status_code == 400
+        assert "Bad Request" in exc_info.value.response_text
+
+
+def test_create_issue_with_invalid_transport() -> None:
+    """Test that an unsupported transport is rejected."""
+    with pytest.raises(ValueError, match="Transport must be one of"):
+        IssueCreator("fake_token", "fake_owner", "fake_repo", transport="urllib")
+
+
+def test_session_uses_tuned_adapter() -> None:
+    """Test the connection pool and retry configuration of the requests session.
+
+    This test verifies that the session mounts an HTTPAdapter with an enlarged pool and a retry
+    policy for gateway errors that only covers GET and HEAD requests, and that keep-alive is
+    requested explicitly.
+    """
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    adapter = creator._session.get_adapter("https://api.github.com/")
+    assert adapter._pool_connections == 32
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert set(adapter.max_retries.status_forcelist) == {502, 503, 504}
+    assert set(adapter.max_retries.allowed_methods) == {"GET", "HEAD"}
+    assert creator._session.headers["Connection"] == "keep-alive"
+
+
+def test_get_issue_uses_etag_cache() -> None:
+    """Test conditional requests when fetching an issue.
+
+    This test verifies that IssueCreator.get_issue() caches the ETag of a 200 response, sends it
+    back as If-None-Match on the next call, and reuses the cached data when GitHub answers 304.
+    """
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    first_response = MagicMock()
+    first_response.status_code = 200
+    first_response.headers = {"ETag": '"abc123"'}
+    first_response.content = json.dumps(_issue_json()).encode()
+
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+    not_modified_response.headers = {"ETag": '"abc123"'}
+
+    with patch.object(creator._session, "get", side_effect=[first_response, not_modified_response]) as mock_get:
+        first = creator.get_issue(1)
+        second = creator.get_issue(1)
+
+        url = "https://api.github.com/repos/fake_owner/fake_repo/issues/1"
+        assert mock_get.call_args_list[0].args == (url,)
+        assert mock_get.call_args_list[0].kwargs["headers"] is None
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc123"'}
+        assert first == second
+        assert second.issue_id == 123456
+        assert second.issue_state == "open"
+
+
+def test_get_issue_http_error() -> None:
+    """Test HTTP error handling when fetching an issue.
+
+    This test simulates a 404 response and verifies that IssueCreator.get_issue() raises an
+    IssueFetchError with the status code and response text.
+    """
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    mock_response.text = "Not Found"
+
+    with patch.object(creator._session, "get", return_value=mock_response):
+        with pytest.raises(IssueFetchError) as exc_info:
+            creator.get_issue(1)
+        assert "HTTP error occurred while fetching the issue." in str(exc_info.value)
+        assert isinstance(exc_info.value, GitHubAPIError)
+        assert not isinstance(exc_info.value, IssueCreationError)
+        assert exc_info.value.status_code == 404
+        assert "Not Found" in exc_info.value.response_text
+
+
+def test_create_issue_waits_for_rate_limit_reset() -> None:
+    """Test client-side rate limit handling.
+
+    This test verifies that once GitHub reports no remaining requests, the next call to
+    IssueCreator.create() sleeps until the X-RateLimit-Reset time before sending the request.
+    """
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+    mock_response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+    mock_response.content = json.dumps(_issue_json()).encode()
+
+    with (
+        patch.object(creator._session, "post", return_value=mock_response),
+        patch("github_issue_creator.github_issue_creator.time.time", return_value=1000.0),
+        patch("github_issue_creator.github_issue_creator.time.sleep") as mock_sleep,
+    ):
+        creator.create(issue)
+        mock_sleep.assert_not_called()
+
+        creator.create(issue)
+        mock_sleep.assert_called_once_with(30.0)
+
+
+def test_create_issue_honors_retry_after() -> None:
+    """Test Retry-After handling on secondary rate limits.
+
+    This test simulates a 429 response carrying a Retry-After header and verifies that the error
+    is raised as usual and that IssueCreator.wait_if_needed() then sleeps for the requested time.
+    """
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 429
+    mock_response.text = "Too Many Requests"
+    mock_response.headers = {"Retry-After": "60"}
+
+    with (
+        patch.object(creator._session, "post", return_value=mock_response),
+        patch("github_issue_creator.github_issue_creator.time.time", return_value=1000.0),
+        patch("github_issue_creator.github_issue_creator.time.sleep") as mock_sleep,
+    ):
+        with pytest.raises(IssueCreationError) as exc_info:
+            creator.create(issue)
+        assert exc_info.value.status_code == 429
+
+        creator.wait_if_needed()
+        mock_sleep.assert_called_once_with(60.0)
+
+
+def test_sessions_are_shared_per_token_and_proxy() -> None:
+    """Test connection pool sharing between IssueCreator instances.
+
+    This test verifies that instances using the same token and proxy settings share one session,
+    that a different token gets its own session, and that IssueCreator.close_all() releases them.
+    """
+    first = IssueCreator("fake_token", "fake_owner", "fake_repo")
+    second = IssueCreator("fake_token", "other_owner", "other_repo")
+    other_token = IssueCreator("other_token", "fake_owner", "fake_repo")
+
+    assert first._session is second._session
+    assert first._session is not other_token._session
+    assert other_token._session.headers["Authorization"] == "token other_token"
+
+    with patch.object(first._session, "close") as mock_close:
+        IssueCreator.close_all()
+        mock_close.assert_called_once()
+
+    assert IssueCreator("fake_token", "fake_owner", "fake_repo")._session is not first._session
+
+
+def test_close_releases_shared_session_with_last_instance() -> None:
+    """Test reference counting of shared sessions.
+
+    This test verifies that closing an IssueCreator keeps the shared session open while another
+    instance still uses it, closes it along with the last instance, and that the next instance
+    for the same token gets a fresh session.
+    """
+    first = IssueCreator("rotating_token", "fake_owner", "fake_repo")
+    session = first._session
+
+    with patch.object(session, "close") as mock_close:
+        with IssueCreator("rotating_token", "other_owner", "other_repo") as second:
+            assert second._session is session
+        mock_close.assert_not_called()
+
+        first.close()
+        first.close()
+        mock_close.assert_called_once()
+
+    assert IssueCreator("rotating_token", "fake_owner", "fake_repo")._session is not session
+
+
+def test_create_issue_success_without_user() -> None:
+    """Test successful creation of an issue when the response has no user.
+
+    This test verifies that IssueCreator.create() returns an IssueResponse whose author is None
+    when the GitHub API response does not include the user who created the issue.
+    """
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+    mock_response.content = json.dumps(_issue_json(user=None)).encode()
+
+    with patch.object(creator._session, "post", return_value=mock_response):
+        result = creator.create(issue)
+
+        assert result.issue_id == 123456
+        assert result.author is None
+
+
+def test_create_issue_server_error() -> None:
+    """Test server error handling during issue creation.
+
+    This test simulates a 5xx response from the GitHub API and verifies that it is reported
+    as an HTTP error, like 4xx responses.
+    """
+    issue = Issue(title="Test", body="This is a test")
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 500
+    mock_response.text = "Internal Server Error"
+
+    with patch.object(creator._session, "post", return_value=mock_response):
+        with pytest.raises(IssueCreationError) as exc_info:
+            creator.create(issue)
+        assert "HTTP error occurred while creating the issue." in str(exc_info.value)
+        assert exc_info.value.status_code == 500
+
+
+def test_prewarm_opens_connection_in_background() -> None:
+    """Test connection prewarming.
+
+    This test verifies that IssueCreator(prewarm=True) sends a HEAD request to the GitHub API
+    from a background daemon thread, and that a failure of that request is silently ignored.
+    """
+    with patch("github_issue_creator.github_issue_creator.threading.Thread") as mock_thread:
+        creator = IssueCreator("fake_token", "fake_owner", "fake_repo", prewarm=True)
+
+        mock_thread.assert_called_once_with(target=creator._prewarm, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+
+    with patch.object(creator._session, "head", side_effect=requests.ConnectionError("Network Error")) as mock_head:
+        creator._prewarm()
+
+        mock_head.assert_called_once_with("https://api.github.com/", timeout=2)
+
+
+def test_create_many_from_running_event_loop() -> None:
+    """Test bulk creation from inside a running event loop.
+
+    This test verifies that IssueCreator.create_many() refuses to run inside an event loop with a
+    clear error, and that IssueCreator.acreate_many() can be awaited there instead.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    issues = [Issue(title="Test", body="This is a test")]
+    creator = IssueCreator("fake_token", "fake_owner", "fake_repo")
+
+    async def fake_post(url: str, content: bytes, headers: dict[str, str], timeout: int) -> httpx.Response:
+        return httpx.Response(
+            201,
+            json=_issue_json(),
+        )
+
+    async def run() -> list[IssueResponse | IssueCreationError]:
+        with pytest.raises(RuntimeError, match="await acreate_many instead"):
+            creator.create_many(issues)
+        return await creator.acreate_many(issues)
+
+    with patch.object(httpx.AsyncClient, "post", side_effect=fake_post):
+        (result,) = asyncio.run(run())
+
+    assert result.issue_id == 123456
+
+
+def test_close_httpx_transport() -> None:
+    """Test that the httpx client is closed when leaving the context manager."""
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    with IssueCreator("fake_token", "fake_owner", "fake_repo", transport="httpx") as creator:
+        assert not creator._client.is_closed
+
+    assert creator._client.is_closed
+
+
+def test_retry_after_is_left_to_rate_limit_tracking() -> None:
+    """Test that the session adapter does not act on Retry-After itself.
+
+    This test sends a real request through the mounted adapter to a local server that answers
+    429 with Retry-After. It verifies that the POST is sent only once, and that the delay is
+    recorded by IssueCreator so that IssueCreator.wait_if_needed() backs off instead.
+    """
+    with _local_server(429, {"Retry-After": "1"}) as (base_url, request_counts):
+        creator = _local_creator("retry_after_token", base_url)
+
+        with pytest.raises(IssueCreationError) as exc_info:
+            creator.create(Issue(title="Test", body="This is a test"), timeout=5)
+        assert exc_info.value.status_code == 429
+        assert request_counts["POST"] == 1
+
+        with patch("github_issue_creator.github_issue_creator.time.sleep") as mock_sleep:
+            creator.wait_if_needed()
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args.args[0] <= 1
+
+
+def test_create_issue_gateway_error_is_not_retried() -> None:
+    """Test that a gateway error on issue creation is not retried.
+
+    This test sends a real request through the mounted adapter to a local server that always
+    answers 502, and verifies that the POST is sent exactly once, since resending it could
+    create a duplicate issue.
+    """
+    with _local_server(502) as (base_url, request_counts):
+        creator = _local_creator("gateway_error_token", base_url)
+
+        with pytest.raises(IssueCreationError) as exc_info:
+            creator.create(Issue(title="Test", body="This is a test"), timeout=5)
+        assert exc_info.value.status_code == 502
+        assert request_counts["POST"] == 1
+
+
+def test_get_issue_gateway_error_is_retried() -> None:
+    """Test that a gateway error when fetching an issue is retried.
+
+    This test sends a real request through the mounted adapter to a local server that always
+    answers 502, and verifies that the idempotent GET is retried before IssueFetchError is raised.
+    """
+    with _local_server(502) as (base_url, request_counts):
+        creator = _local_creator("gateway_error_get_token", base_url)
+
+        with patch("urllib3.util.retry.time.sleep"):
+            with pytest.raises(IssueFetchError) as exc_info:
+                creator.get_issue(1, timeout=5)
+        assert exc_info.value.status_code == 502
+        assert request_counts["GET"] == 4